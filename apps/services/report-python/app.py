@@ -1,15 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Dict
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from time import monotonic, perf_counter
+from typing import Any, AsyncIterator, Dict
 
 from fastapi import FastAPI, HTTPException, Response, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+import orjson
 from pydantic import BaseModel
-from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from report_renderer import generate_pdf_bytes
+from report_renderer import generate_pdf_bytes, warm_up
 
 
 # ---- Logging ----
@@ -17,8 +28,28 @@ logger = logging.getLogger("report-service")
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
 
+# ---- Lifespan ----
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Load ReportLab's font metrics and caches before serving traffic; forked
+    # pool workers inherit them, so no request pays the first-render cost.
+    warm_up()
+    # ReportLab layout is pure Python, so threads serialize on the GIL;
+    # render in worker processes instead.
+    app.state.pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    try:
+        yield
+    finally:
+        app.state.pool.shutdown(wait=False, cancel_futures=True)
+
+
 # ---- FastAPI app ----
-app = FastAPI(title="AI Validator Report Service", version="0.1.1")
+app = FastAPI(
+    title="AI Validator Report Service",
+    version="0.1.1",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # CORS (tune origins as needed)
 app.add_middleware(
@@ -27,14 +58,27 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],  # let cross-origin clients read it for If-None-Match
 )
 
+# Compress JSON responses; PDFs opt out below since they are already
+# Flate-compressed internally.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+# FastAPI's stock HTTPException handler builds a stdlib JSONResponse; encode
+# error bodies with orjson like every other JSON response.
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    headers = getattr(exc, "headers", None)
+    if exc.status_code in (204, 304):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
+
 
 # ---- Timing middleware ----
 @app.middleware("http")
 async def timing_middleware(request: Request, call_next):
-    from time import perf_counter
-
     start = perf_counter()
     logger.info(f"→ {request.method} {request.url.path}")
     try:
@@ -45,6 +89,61 @@ async def timing_middleware(request: Request, call_next):
         logger.info(f"← {request.method} {request.url.path} in {dur_ms:.1f}ms")
 
 
+# ---- Render concurrency ----
+# PDF builds are CPU-bound; cap in-flight renders so a burst of requests
+# doesn't queue more work than the process pool can run.
+_RENDER_SLOTS = asyncio.Semaphore(os.cpu_count() or 1)
+
+
+async def _render_in_pool(data: Dict[str, Any]) -> bytes:
+    async with _RENDER_SLOTS:
+        loop = asyncio.get_running_loop()
+        pool = app.state.pool
+        try:
+            return await loop.run_in_executor(pool, generate_pdf_bytes, data)
+        except BrokenProcessPool:
+            # A worker died (OOM kill, segfault) and the executor is unusable
+            # from here on. Swap in a fresh pool and retry once.
+            logger.warning("Render pool broken; restarting it")
+            if app.state.pool is pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+                app.state.pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+            return await loop.run_in_executor(app.state.pool, generate_pdf_bytes, data)
+
+
+# ---- Rendered PDF cache ----
+# Identical payloads (client retries, dashboard refreshes) reuse the bytes
+# from the last render instead of rebuilding the document. Entries expire so
+# the report's "Generated on" footer never goes stale.
+_PDF_CACHE_SIZE = 128
+_PDF_CACHE_TTL = 300.0  # seconds
+_pdf_cache: OrderedDict[bytes, tuple[float, bytes]] = OrderedDict()
+
+
+def _payload_key(data: Dict[str, Any]) -> bytes:
+    try:
+        raw = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        # orjson rejects integers wider than 64 bits, which valid JSON allows.
+        raw = json.dumps(data, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+async def _cached_render(data: Dict[str, Any], key: bytes) -> bytes:
+    entry = _pdf_cache.get(key)
+    if entry is not None:
+        created, pdf = entry
+        if monotonic() - created < _PDF_CACHE_TTL:
+            _pdf_cache.move_to_end(key)
+            return pdf
+        del _pdf_cache[key]
+    pdf = await _render_in_pool(data)
+    _pdf_cache[key] = (monotonic(), pdf)
+    if len(_pdf_cache) > _PDF_CACHE_SIZE:
+        _pdf_cache.popitem(last=False)
+    return pdf
+
+
 class RenderInput(BaseModel):
     """Accept any JSON payload; keep keys for downstream renderer.
 
@@ -66,19 +165,30 @@ async def health():
     return {"status": "ok"}
 
 
-@app.post("/render", summary="Render", response_class=Response)
-async def render(payload: RenderInput) -> Response:
-    """Generate a PDF from the incoming JSON.
+async def _pdf_response(data: Dict[str, Any], request: Request) -> Response:
+    """Render `data` to a PDF response.
 
-    - Offloads CPU/IO work to a thread (so the event loop never stalls).
+    - Offloads CPU work to a worker process (so the event loop never stalls
+      and renders run in parallel across cores).
+    - Limits concurrent renders to the number of CPUs.
+    - Serves repeated payloads from an in-memory LRU of rendered PDFs.
+    - Answers 304 when the client already holds the PDF for this payload.
     - Applies an overall timeout to prevent infinite hangs.
     """
-    # Convert to plain dict for the renderer
-    data: Dict[str, Any] = payload.model_dump()
+    key = _payload_key(data)
+    etag = f'W/"{key.hex()}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+
+    # Deliberately non-standard: RFC 9110 prescribes 412 for a matching
+    # If-None-Match on POST, and browsers never revalidate POSTs. This 304 is
+    # a shortcut for custom clients that resend the stored ETag themselves.
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=304, headers=cache_headers)
 
     try:
         pdf_bytes: bytes = await asyncio.wait_for(
-            run_in_threadpool(generate_pdf_bytes, data),
+            _cached_render(data, key),
             timeout=30.0,  # seconds; adjust based on expected payload size
         )
     except asyncio.TimeoutError as e:
@@ -94,8 +204,30 @@ async def render(payload: RenderInput) -> Response:
 
     headers = {
         "Content-Disposition": "inline; filename=report.pdf",
-        "Cache-Control": "no-store",
+        "Content-Encoding": "identity",
+        **cache_headers,
     }
     return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
 
 
+@app.post("/render", summary="Render", response_class=Response)
+async def render(request: Request) -> Response:
+    """Generate a PDF from the incoming JSON.
+
+    The body is decoded straight to a dict with orjson; no schema
+    validation runs on this path. Use `/render/validated` for that.
+    """
+    try:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail="Request body must be valid JSON") from e
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+    return await _pdf_response(data, request)
+
+
+@app.post("/render/validated", summary="Render (validated)", response_class=Response)
+async def render_validated(payload: RenderInput, request: Request) -> Response:
+    """Generate a PDF after validating the JSON against `RenderInput`."""
+    # Convert to plain dict for the renderer
+    return await _pdf_response(payload.model_dump(), request)
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import io
+import os
 import re
-from typing import Any, Dict, List
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterable, List, Tuple
 from datetime import datetime
+from functools import lru_cache
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.platypus import (
     SimpleDocTemplate,
     Paragraph,
@@ -18,6 +24,19 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+__all__ = [
+    "generate_pdf_bytes",
+    "generate_pdf_bytes_batch",
+    "generate_pdf_to",
+    "warm_up",
+]
+
+# -------- Fonts --------
+# Load the built-in font metrics once per process so the first render
+# doesn't pay for it.
+for _font_name in ("Helvetica", "Helvetica-Bold"):
+    pdfmetrics.getFont(_font_name)
+
 # -------- Color Scheme & Constants --------
 COLORS = {
     "primary": colors.HexColor("#2C5AA0"),   
@@ -29,25 +48,147 @@ COLORS = {
     "light_text": colors.HexColor("#6C757D"),   
 }
 
+# -------- Shared Styles (built once at import) --------
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    name="Title",
+    parent=_STYLES["Heading1"],
+    fontSize=20,
+    textColor=COLORS["primary"],
+    spaceAfter=6,
+    alignment=1,
+    fontName="Helvetica-Bold",
+)
+
+_H_STYLE = ParagraphStyle(
+    name="Heading",
+    parent=_STYLES["Heading3"],
+    fontSize=12,
+    textColor=COLORS["primary"],
+    spaceAfter=6,
+    fontName="Helvetica-Bold",
+)
+
+_NORMAL = ParagraphStyle(
+    name="Normal",
+    parent=_STYLES["BodyText"],
+    fontSize=10,
+    textColor=COLORS["text"],
+    leading=12,
+)
+
+_WRAP_STYLE = ParagraphStyle(
+    name="WrapBody",
+    parent=_NORMAL,
+    fontSize=9,
+    leading=12,
+    wordWrap="CJK",
+    splitLongWords=True,
+)
+
+_SMALL = ParagraphStyle(
+    name="Small",
+    parent=_NORMAL,
+    fontSize=9,
+    textColor=COLORS["light_text"],
+    leading=11,
+)
+
+_HIGHLIGHT_STYLE = ParagraphStyle(
+    name="Highlight",
+    parent=_NORMAL,
+    fontSize=11,
+    textColor=COLORS["primary"],
+    leading=13,
+    fontName="Helvetica-Bold",
+)
+
+_FOOTER_STYLE = ParagraphStyle(
+    name="Footer",
+    parent=_SMALL,
+    alignment=1,  # Center
+    textColor=COLORS["light_text"],
+)
+
+@lru_cache(maxsize=None)
+def _summary_style(color: colors.Color) -> ParagraphStyle:
+    """Executive summary style for one status color (only a handful exist)."""
+    return ParagraphStyle(
+        name="Summary",
+        parent=_HIGHLIGHT_STYLE,
+        textColor=color,
+        backColor=COLORS["background"],
+        borderPadding=8,
+        leftIndent=10,
+    )
+
+# -------- Shared Table Styles --------
+_GRID_COLOR = colors.HexColor("#DEE2E6")
+_ROW_BG = [colors.white, COLORS["background"]]
+
+_KPI_TABLE_STYLE = TableStyle([
+    ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
+    ("FONTSIZE", (0, 0), (-1, -1), 10),
+    ("ALIGN", (0, 0), (0, -1), "LEFT"),
+    ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("PADDING", (0, 0), (-1, -1), 6),
+    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+    ("LINEBELOW", (0, 0), (-1, -1), 0.5, COLORS["background"]),
+])
+
+_FIELDS_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), COLORS["primary"]),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTSIZE", (0, 0), (-1, 0), 9),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTNAME", (0, 1), (-1, -1), _WRAP_STYLE.fontName),
+    ("FONTSIZE", (0, 1), (-1, -1), _WRAP_STYLE.fontSize),
+    ("LEADING", (0, 1), (-1, -1), _WRAP_STYLE.leading),
+    ("TEXTCOLOR", (0, 1), (-1, -1), _WRAP_STYLE.textColor),
+    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), _ROW_BG),
+    ("GRID", (0, 0), (-1, -1), 0.5, _GRID_COLOR),
+    ("PADDING", (0, 0), (-1, -1), 6),
+])
+
+# Status cell highlight, keyed by lower-cased status.
+_STATUS_BG = {
+    "matched": colors.HexColor("#D4EDDA"),
+    "missing": colors.HexColor("#F8D7DA"),
+    "extra": colors.HexColor("#FFF3CD"),
+    "unmatched": colors.HexColor("#E2E3E5"),
+}
+
+# -------- Page Geometry --------
+_PAGESIZE = A4
+_MARGIN = 14 * mm
+_USABLE_W = _PAGESIZE[0] - 2 * _MARGIN
+# Field, Status, Issue, Expected, Actual, Suggestion
+_COL_WIDTHS = [_USABLE_W * f for f in (0.16, 0.12, 0.24, 0.14, 0.14, 0.20)]
+# Label, value
+_KPI_COL_WIDTHS = [50 * mm, 45 * mm]
+
+# Rows per Field Details table; larger reports are split into several tables.
+_TABLE_CHUNK_ROWS = 100
+
 # -------- Helper Functions --------
-def _soft_wrap(text: str | None, every: int = 30) -> str:
+_SOFT_WRAP_EVERY = 30
+_LONG_TOKEN_RE = re.compile(rf"(\S{{{_SOFT_WRAP_EVERY}}})(?=\S)")
+_CLIP_LIMIT = 1000
+
+def _soft_wrap(text: str | None, every: int = _SOFT_WRAP_EVERY) -> str:
     """Insert soft hyphens in very long unbroken tokens only."""
     if not text:
         return ""
-    
-    words = text.split()
-    wrapped_words = []
-    
-    for word in words:
-        if len(word) > every:
-            wrapped_word = '­'.join([word[i:i+every] for i in range(0, len(word), every)])
-            wrapped_words.append(wrapped_word)
-        else:
-            wrapped_words.append(word)
-    
-    return ' '.join(wrapped_words)
+    if len(text) <= every:
+        return text
+    pattern = _LONG_TOKEN_RE if every == _SOFT_WRAP_EVERY else re.compile(rf"(\S{{{every}}})(?=\S)")
+    return pattern.sub("\\1\u00ad", text)
 
-def _clip(text: str, limit: int = 1000) -> str:
+def _clip(text: str, limit: int = _CLIP_LIMIT) -> str:
     """Safely truncate very long text with ellipsis."""
     if text is None:
         return ""
@@ -57,12 +198,63 @@ def _clip(text: str, limit: int = 1000) -> str:
 
 def _p(text: str, style: ParagraphStyle) -> Paragraph:
     """Create a Paragraph with safe text handling."""
+    if not text:
+        return Paragraph("", style)
+    if len(text) <= _CLIP_LIMIT and not _LONG_TOKEN_RE.search(text):
+        # Nothing to clip or soft-hyphenate.
+        return Paragraph(text, style)
     return Paragraph(_soft_wrap(_clip(text)), style)
 
+def _cell(text: str, width: float, padding: float = 6) -> Any:
+    """Return plain text when it fits on one table line, else a wrapping Paragraph."""
+    if (
+        "<" not in text
+        and "&" not in text
+        and "\n" not in text
+        and stringWidth(text, _WRAP_STYLE.fontName, _WRAP_STYLE.fontSize) <= width - 2 * padding
+    ):
+        return text
+    return _p(text, _WRAP_STYLE)
+
+# Values treated as absent when joining type/format parts. A tuple rather
+# than a frozenset: payload values may be unhashable (lists, dicts).
+_EMPTY_PARTS = (None, "", "None")
+
+def _fmt_two(a: Any, b: Any) -> str:
+    """Join two optional parts with a space, skipping absent ones."""
+    a_ok = a not in _EMPTY_PARTS
+    b_ok = b not in _EMPTY_PARTS
+    if a_ok and b_ok:
+        return f"{a} {b}".strip()
+    if a_ok:
+        return str(a).strip()
+    if b_ok:
+        return str(b).strip()
+    return ""
+
+def _fmt_three(a: Any, b: Any, c: Any) -> str:
+    """Join three optional parts with spaces, skipping absent ones."""
+    if c in _EMPTY_PARTS:
+        return _fmt_two(a, b)
+    a_ok = a not in _EMPTY_PARTS
+    b_ok = b not in _EMPTY_PARTS
+    if a_ok and b_ok:
+        return f"{a} {b} {c}".strip()
+    if a_ok:
+        return f"{a} {c}".strip()
+    if b_ok:
+        return f"{b} {c}".strip()
+    return str(c).strip()
+
 def _fmt_date(dt: str | None) -> str:
     """Format date string to readable format."""
     if not dt:
         return ""
+    return _fmt_date_cached(dt if isinstance(dt, str) else str(dt))
+
+@lru_cache(maxsize=1024)
+def _fmt_date_cached(dt: str) -> str:
+    """Parse and format one date string; reports often share timestamps."""
     try:
         if "T" in dt:
             dt = dt.replace("Z", "+00:00")
@@ -90,36 +282,40 @@ def _format_accuracy_score(score: Any) -> str:
     """Format accuracy score consistently."""
     if score is None:
         return "N/A"
+    if isinstance(score, (int, float)):
+        # Common case: skip the try/except and float() conversion.
+        return f"{score:.1%}" if score <= 1.0 else f"{score:.1f}%"
     try:
         score_float = float(score)
         return f"{score_float:.1%}" if score_float <= 1.0 else f"{score_float:.1f}%"
     except (TypeError, ValueError):
         return str(score)
 
-def _compute_status_counts(fields: List[Dict[str, Any]]) -> Dict[str, int]:
+_STATUS_KEYS = ("matched", "missing", "extra", "unmatched")
+
+def _annotate(fields: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], str]]:
+    """Pair each field with its lower-cased status, computed once."""
+    return [(f, str(f.get("status") or "").lower()) for f in fields]
+
+def _compute_status_counts(annotated: List[Tuple[Dict[str, Any], str]]) -> Dict[str, int]:
     """Calculate statistics for field statuses."""
-    stats = {"matched": 0, "missing": 0, "extra": 0, "unmatched": 0, "other": 0}
-    for f in fields:
-        s = str(f.get("status") or "").lower()
-        if s in stats:
-            stats[s] += 1
-        elif s:
-            stats["other"] += 1
+    counts = Counter(s for _, s in annotated)
+    stats = {k: counts[k] for k in _STATUS_KEYS}
+    # Anything else with a non-empty status is "other".
+    stats["other"] = len(annotated) - sum(stats.values()) - counts[""]
     return stats
 
 def _create_text_chart(stats: Dict[str, int], width: int = 20) -> str:
     """Create a text-based visualization."""
-    total = sum(stats.values())
+    total = sum(stats[k] for k in _STATUS_KEYS) + stats.get("other", 0)
     if total == 0:
         return "No data available"
     
-    chart = []
-    for status, count in stats.items():
-        if status != "other" and count > 0:
-            percentage = (count / total) * 100
-            chart.append(f"{status.capitalize():<10} {count} fields ({percentage:.1f}%)")
-    
-    return "<br/>".join(chart)
+    return "<br/>".join(
+        f"{status.capitalize():<10} {stats[status]} fields ({stats[status] / total * 100:.1f}%)"
+        for status in _STATUS_KEYS
+        if stats[status]
+    )
 
 def _generate_recommendations(stats: Dict[str, int], total_fields: int) -> str:
     """Generate actionable recommendations based on validation results."""
@@ -163,136 +359,115 @@ def _create_executive_summary(stats: Dict[str, int], total_fields: int) -> tuple
     
     return summary, color
 
-def _group_fields_by_priority(fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _group_fields_by_priority(
+    annotated: List[Tuple[Dict[str, Any], str]], stats: Dict[str, int]
+) -> List[Dict[str, Any]]:
     """Group fields by priority (issues first)."""
     priority_order = ["missing", "extra", "unmatched", "matched", "other"]
+    # Fields with an empty status aren't counted in stats but sort as "other".
+    counts = dict(stats, other=stats["other"] + len(annotated) - sum(stats.values()))
+    present = [status for status in priority_order if counts[status]]
+    if len(present) <= 1:
+        # Single bucket: priority order is the input order.
+        return [field for field, _ in annotated]
+
     grouped = {status: [] for status in priority_order}
+    other = grouped["other"]
     
-    for field in fields:
-        status = str(field.get("status", "")).lower()
-        grouped.get(status, grouped["other"]).append(field)
+    for field, status in annotated:
+        grouped.get(status, other).append(field)
     
-    return [field for status in priority_order for field in grouped[status]]
+    return [field for status in present for field in grouped[status]]
 
 # -------- Core Rendering Function --------
 def generate_pdf_bytes(data: Dict[str, Any]) -> bytes:
     """Generate professional PDF report with clean, minimal design."""
-
     buf = io.BytesIO()
-    margin = 14 * mm
-    pagesize = A4
+    generate_pdf_to(buf, data)
+    return buf.getvalue()
+
+def generate_pdf_bytes_batch(
+    items: Iterable[Dict[str, Any]], workers: int | None = None
+) -> List[bytes]:
+    """Render many reports, spread across worker processes.
+
+    `workers=1` (or a single item) renders in-process; otherwise a process
+    pool of `workers` (default: CPU count) renders items in chunks.
+    """
+    items = list(items)
+    if workers == 1 or len(items) <= 1:
+        return [generate_pdf_bytes(d) for d in items]
+    n_workers = workers or os.cpu_count() or 1
+    # Batch items per task to amortize pickling/IPC, but keep every worker busy.
+    chunksize = max(1, min(8, len(items) // n_workers))
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        return list(pool.map(generate_pdf_bytes, items, chunksize=chunksize))
+
+def generate_pdf_to(stream: BinaryIO, data: Dict[str, Any]) -> None:
+    """Write the PDF report straight into a seekable binary stream.
+
+    Lets callers render into a file or spooled temp file without holding
+    an extra copy of the document as `bytes`.
+    """
+
+    # Read the top-level payload keys once.
+    api_name = data.get("api_name")
+    validation_date = data.get("validation_date")
+    api_version = data.get("api_version")
+    accuracy_score = data.get("accuracy_score")
+    fields: List[Dict[str, Any]] = list(data.get("fields") or [])
+    total_fields = _safe_int(data.get("total_fields_compared", len(fields)))
 
+    start = stream.tell()
     doc = SimpleDocTemplate(
-        buf,
-        pagesize=pagesize,
-        leftMargin=margin,
-        rightMargin=margin,
-        topMargin=margin,
-        bottomMargin=margin,
-        title=str(data.get("api_name") or "AI Validator Report"),
+        stream,
+        pagesize=_PAGESIZE,
+        leftMargin=_MARGIN,
+        rightMargin=_MARGIN,
+        topMargin=_MARGIN,
+        bottomMargin=_MARGIN,
+        title=str(api_name or "AI Validator Report"),
         author="AI Validator",
-    )
-
-    styles = getSampleStyleSheet()
-    
-    title_style = ParagraphStyle(
-        name="Title",
-        parent=styles["Heading1"],
-        fontSize=20,
-        textColor=COLORS["primary"],
-        spaceAfter=6,
-        alignment=1,  
-        fontName="Helvetica-Bold",
-    )
-    
-    h_style = ParagraphStyle(
-        name="Heading",
-        parent=styles["Heading3"],
-        fontSize=12,
-        textColor=COLORS["primary"],
-        spaceAfter=6,
-        fontName="Helvetica-Bold",
-    )
-    
-    normal = ParagraphStyle(
-        name="Normal",
-        parent=styles["BodyText"],
-        fontSize=10,
-        textColor=COLORS["text"],
-        leading=12,
-    )
-    
-    small = ParagraphStyle(
-        name="Small",
-        parent=normal,
-        fontSize=9,
-        textColor=COLORS["light_text"],
-        leading=11,
-    )
-    
-    wrap_style = ParagraphStyle(
-        name="WrapBody",
-        parent=normal,
-        fontSize=9,
-        leading=12,
-        wordWrap="CJK",
-        splitLongWords=True,
-    )
-    
-    highlight_style = ParagraphStyle(
-        name="Highlight",
-        parent=normal,
-        fontSize=11,
-        textColor=COLORS["primary"],
-        leading=13,
-        fontName="Helvetica-Bold",
+        pageCompression=1,
+        invariant=1,
     )
 
     elements: List[Any] = []
 
     # --- Header Section ---
-    title = str(data.get("api_name") or "AI Validation Report")
-    elements.append(_p(title, title_style))
+    title = str(api_name or "AI Validation Report")
+    elements.append(_p(title, _TITLE_STYLE))
     
     # Minimal metadata
     metadata = []
-    if data.get("validation_date"):
-        metadata.append(f"Validated: {_fmt_date(data['validation_date'])}")
-    if data.get("api_version"):
-        metadata.append(f"Version: {data['api_version']}")
+    if validation_date:
+        metadata.append(f"Validated: {_fmt_date(validation_date)}")
+    if api_version:
+        metadata.append(f"Version: {api_version}")
     
     if metadata:
-        elements.append(_p(" • ".join(metadata), small))
+        elements.append(_p(" • ".join(metadata), _SMALL))
     
     elements.append(Spacer(0, 8 * mm))
 
     # --- Fields Data ---
-    fields: List[Dict[str, Any]] = list(data.get("fields") or [])
-    stats = _compute_status_counts(fields)
-    total_fields = _safe_int(data.get("total_fields_compared", len(fields)))
+    annotated = _annotate(fields)
+    stats = _compute_status_counts(annotated)
 
     # --- Executive Summary ---
     summary_text, summary_color = _create_executive_summary(stats, total_fields)
     
-    summary_style = ParagraphStyle(
-        name="Summary",
-        parent=highlight_style,
-        textColor=summary_color,
-        backColor=COLORS["background"],
-        borderPadding=8,
-        leftIndent=10,
-    )
-    
-    elements.append(_p(summary_text, summary_style))
-    elements.append(Spacer(0, 6 * mm))
-
-    # --- Key Metrics ---
-    elements.append(_p("Key Metrics", h_style))
+    elements.extend((
+        _p(summary_text, _summary_style(summary_color)),
+        Spacer(0, 6 * mm),
+        # --- Key Metrics ---
+        _p("Key Metrics", _H_STYLE),
+    ))
     
     success_rate = (stats['matched'] / total_fields * 100) if total_fields > 0 else 0
     
     kpi_rows = [
-        ["Accuracy", _format_accuracy_score(data.get("accuracy_score"))],
+        ["Accuracy", _format_accuracy_score(accuracy_score)],
         ["Matched", f"{stats['matched']} of {total_fields} fields"],
         ["Missing Fields", f"{stats['missing']}"],
         ["Extra Fields", f"{stats['extra']}"],
@@ -300,151 +475,110 @@ def generate_pdf_bytes(data: Dict[str, Any]) -> bytes:
     ]
     
     try:
-        kpi_table = Table(kpi_rows, colWidths=[50 * mm, 45 * mm])
-        kpi_table.setStyle(TableStyle([
-            ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
-            ("FONTSIZE", (0, 0), (-1, -1), 10),
-            ("ALIGN", (0, 0), (0, -1), "LEFT"),
-            ("ALIGN", (1, 0), (1, -1), "RIGHT"),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("PADDING", (0, 0), (-1, -1), 6),
-            ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-            ("LINEBELOW", (0, 0), (-1, -1), 0.5, COLORS["background"]),
-        ]))
-        elements.append(kpi_table)
-        elements.append(Spacer(0, 4 * mm))
+        kpi_table = Table(kpi_rows, colWidths=_KPI_COL_WIDTHS)
+        kpi_table.setStyle(_KPI_TABLE_STYLE)
+        elements.extend((kpi_table, Spacer(0, 4 * mm)))
     except Exception:
     
-        elements.append(_p(f"Matched: {stats['matched']} | Missing: {stats['missing']} | Extra: {stats['extra']}", normal))
+        elements.append(_p(f"Matched: {stats['matched']} | Missing: {stats['missing']} | Extra: {stats['extra']}", _NORMAL))
 
     # --- Field Distribution ---
     if total_fields > 0:
-        elements.append(_p("Field Distribution", h_style))
-        elements.append(_p(_create_text_chart(stats), small))
-        elements.append(Spacer(0, 6 * mm))
+        elements.extend((
+            _p("Field Distribution", _H_STYLE),
+            _p(_create_text_chart(stats), _SMALL),
+            Spacer(0, 6 * mm),
+        ))
 
     # --- Detailed Table ---
     if fields:
-        elements.append(_p("Field Details", h_style))
-        elements.append(Spacer(0, 2 * mm))
-        sorted_fields = _group_fields_by_priority(fields)
+        elements.extend((_p("Field Details", _H_STYLE), Spacer(0, 2 * mm)))
+        sorted_fields = _group_fields_by_priority(annotated, stats)
 
         table_header = ["Field", "Status", "Issue", "Expected", "Actual", "Suggestion"]
 
-        page_w, _ = pagesize
-        usable_w = page_w - doc.leftMargin - doc.rightMargin
-        col_widths = [
-            usable_w * 0.16,  
-            usable_w * 0.12,  
-            usable_w * 0.24,  
-            usable_w * 0.14,  
-            usable_w * 0.14,  
-            usable_w * 0.20,  
+        col_widths = _COL_WIDTHS
+
+        # One pass over the fields: pull, join and clip the six cell texts.
+        clip = _clip
+        row_texts = [
+            (
+                clip(str(f.get("field_name") or f.get("name") or "—")),
+                clip(str(f.get("status") or "—")),
+                clip(str(f.get("issue") or f.get("description") or f.get("rationale") or "")),
+                clip(_fmt_two(f.get("expected_type"), f.get("expected_format")) or "—"),
+                clip(_fmt_three(f.get("actual_type"), f.get("actual_format"), f.get("actual_info")) or "—"),
+                clip(str(f.get("suggestion") or "") or "—"),
+            )
+            for f in sorted_fields
+        ]
+        status_list = [row[1].lower() for row in row_texts]
+
+        # Cells go in as plain strings; only text with markup or too wide
+        # for one line of its column pays for a Paragraph.
+        cell = _cell
+        w_field, w_status, w_issue, w_expected, w_actual, w_suggestion = col_widths
+        data_rows: List[Any] = [
+            (
+                cell(name, w_field),
+                cell(status.capitalize(), w_status),
+                cell(issue, w_issue),
+                cell(expected, w_expected),
+                cell(actual, w_actual),
+                cell(suggestion, w_suggestion),
+            )
+            for name, status, issue, expected, actual, suggestion in row_texts
         ]
-
-        data_rows: List[List[Any]] = [table_header]
-        status_list: List[str] = []
-
-        for f in sorted_fields:
-            field_name = str(f.get("field_name") or f.get("name") or "—")
-            status_raw = str(f.get("status") or "—")
-            status_list.append(status_raw.lower())
-
-            issue = f.get("issue") or f.get("description") or f.get("rationale") or ""
-            expected = " ".join(
-                str(x) for x in [f.get("expected_type"), f.get("expected_format")]
-                if x not in (None, "", "None")
-            ).strip()
-            actual = " ".join(
-                str(x) for x in [f.get("actual_type"), f.get("actual_format"), f.get("actual_info")]
-                if x not in (None, "", "None")
-            ).strip()
-            suggestion = str(f.get("suggestion") or "")
-
-            row = [
-                _p(field_name, wrap_style),
-                _p(status_raw.capitalize(), wrap_style),
-                _p(issue, wrap_style),
-                _p(expected or "—", wrap_style),
-                _p(actual or "—", wrap_style),
-                _p(suggestion or "—", wrap_style),
-            ]
-            data_rows.append(row)
 
         try:
-            table = LongTable(
-                data_rows,
-                colWidths=col_widths,
-                repeatRows=1,
-                splitByRow=1,
-                spaceBefore=2,
-                spaceAfter=2,
-            )
+            # One big table lays out superlinearly in ReportLab, so emit a
+            # series of smaller tables, each with its own header row.
+            tables: List[Any] = []
+            for start_row in range(0, len(data_rows), _TABLE_CHUNK_ROWS):
+                chunk = data_rows[start_row:start_row + _TABLE_CHUNK_ROWS]
+                table = LongTable(
+                    [table_header, *chunk],
+                    colWidths=col_widths,
+                    repeatRows=1,
+                    splitByRow=1,
+                    spaceBefore=2,
+                    spaceAfter=2,
+                )
+
+                table.setStyle(_FIELDS_TABLE_STYLE)
+
+                # Only the per-row status highlights vary between reports.
+                chunk_statuses = status_list[start_row:start_row + _TABLE_CHUNK_ROWS]
+                table.setStyle(TableStyle([
+                    ("BACKGROUND", (1, i), (1, i), _STATUS_BG[status])
+                    for i, status in enumerate(chunk_statuses, start=1)
+                    if status in _STATUS_BG
+                ]))
+                tables.append(table)
+
+            elements.extend(tables)
 
-           
-            style_cmds = [
-           
-                ("BACKGROUND", (0, 0), (-1, 0), COLORS["primary"]),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("FONTSIZE", (0, 0), (-1, 0), 9),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                
-
-                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, COLORS["background"]]),
-             
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#DEE2E6")),
-                ("PADDING", (0, 0), (-1, -1), 6),
-            ]
-
-            status_colors = {
-                "matched": colors.HexColor("#D4EDDA"),
-                "missing": colors.HexColor("#F8D7DA"),
-                "extra": colors.HexColor("#FFF3CD"),
-                "unmatched": colors.HexColor("#E2E3E5"),
-            }
-
-            for i, status in enumerate(status_list, start=1):
-                status_lower = status.lower()
-                for key, color in status_colors.items():
-                    if key in status_lower:
-                        style_cmds.append(("BACKGROUND", (1, i), (1, i), color))
-                        break
-
-            table.setStyle(TableStyle(style_cmds))
-            elements.append(table)
-            
         except Exception as e:
-            elements.append(_p("Error displaying detailed table. Showing summary:", normal))
+            elements.append(_p("Error displaying detailed table. Showing summary:", _NORMAL))
             for i, f in enumerate(sorted_fields[:10]):
                 field_name = str(f.get("field_name") or f.get("name") or "Unknown")
                 status = str(f.get("status") or "—")
-                elements.append(_p(f"{i+1}. {field_name}: {status}", wrap_style))
+                elements.append(_p(f"{i+1}. {field_name}: {status}", _WRAP_STYLE))
             if len(sorted_fields) > 10:
-                elements.append(_p(f"... and {len(sorted_fields) - 10} more fields", wrap_style))
+                elements.append(_p(f"... and {len(sorted_fields) - 10} more fields", _WRAP_STYLE))
     else:
-        elements.append(_p("No field-level details provided.", normal))
+        elements.append(_p("No field-level details provided.", _NORMAL))
 
-    # --- Recommendations Section ---
-    elements.append(Spacer(0, 6 * mm))
-    elements.append(_p("Recommended Actions", h_style))
-    
+    # --- Recommendations Section & Footer ---
     recommendations = _generate_recommendations(stats, total_fields)
-    elements.append(_p(recommendations, wrap_style))
-
-    # --- Footer ---
-    elements.append(Spacer(0, 8 * mm))
-    
-    footer_style = ParagraphStyle(
-        name="Footer",
-        parent=small,
-        alignment=1,  # Center
-        textColor=COLORS["light_text"],
-    )
-    
     footer_text = f"Generated on {datetime.now().strftime('%Y-%m-%d at %H:%M')} • AI Validator Report"
-    elements.append(_p(footer_text, footer_style))
+    elements.extend((
+        Spacer(0, 6 * mm),
+        _p("Recommended Actions", _H_STYLE),
+        _p(recommendations, _WRAP_STYLE),
+        Spacer(0, 8 * mm),
+        _p(footer_text, _FOOTER_STYLE),
+    ))
 
     # --- Build Document ---
     if not elements:
@@ -452,16 +586,19 @@ def generate_pdf_bytes(data: Dict[str, Any]) -> bytes:
     
     try:
         doc.build(elements)
-        buf.seek(0)
-        return buf.getvalue()
     except Exception as e:
-        error_buf = io.BytesIO()
-        error_doc = SimpleDocTemplate(error_buf, pagesize=A4)
+        # Drop any partial output and write an error page in its place.
+        stream.seek(start)
+        stream.truncate()
+        error_doc = SimpleDocTemplate(stream, pagesize=_PAGESIZE, pageCompression=1, invariant=1)
         error_elements = [
-            _p("Error Generating Report", title_style),
-            _p(f"An error occurred: {str(e)}", normal),
-            _p("Please check the input data and try again.", normal),
+            _p("Error Generating Report", _TITLE_STYLE),
+            _p(f"An error occurred: {str(e)}", _NORMAL),
+            _p("Please check the input data and try again.", _NORMAL),
         ]
         error_doc.build(error_elements)
-        error_buf.seek(0)
-        return error_buf.getvalue()
\ No newline at end of file
+
+
+def warm_up() -> None:
+    """Render a throwaway report so fonts and layout caches are loaded."""
+    generate_pdf_bytes({"api_name": "warmup", "fields": []})